@@ -2,24 +2,35 @@
 A model of a zombie survival game wherein the player has to reach
 the hospital whilst evading zombies.
 """
-from typing import Tuple, Optional, Dict, List
+from typing import Tuple, Optional, Dict, List, Sequence, Iterable
+import collections
+import itertools
 import random
+import re
+import sys
 from constants import *
 
 
 ## Support code
 
-def random_directions() -> List[Tuple[int, int]]:
+# Byte stored in Grid._cells for a tile that does not contain an entity.
+EMPTY_CELL = ord(" ")
+
+# Every ordering of OFFSETS, so a random ordering is a single choice.
+_DIRECTION_ORDERS = tuple(itertools.permutations(OFFSETS))
+
+
+def random_directions() -> Tuple[Tuple[int, int], ...]:
     """
-    Return a randomly sorted list of directions.
+    Return a randomly sorted sequence of directions.
 
-    The list will always contain (0, 1), (0, -1), (1, 0), (-1, 0)
+    The sequence will always contain (0, 1), (0, -1), (1, 0), (-1, 0)
     but the order will be random.
 
     Each direction is represented by an offset that is the change
     in (x, y) coordinates that results from moving in the direction.
     """
-    return random.sample(OFFSETS, k=4)
+    return random.choice(_DIRECTION_ORDERS)
 
 
 def first_in_direction(
@@ -34,16 +45,10 @@ def first_in_direction(
     Returns: A tuple of a position and the first entity found in the
         given direction, None if no entity found
     """
-    position = start.add(offset)
-
-    while grid.in_bounds(position):
-        entity = grid.get_entity(position)
-        if entity is not None:
-            return position, entity
-
-        position = position.add(offset)
-
-    return None
+    position = grid.scan_direction(start, offset)
+    if position is None:
+        return None
+    return position, grid.get_entity(position)
 
 
 class Position:
@@ -64,6 +69,8 @@ class Position:
         4
     """
 
+    __slots__ = ('_x', '_y', '_hash')
+
     def __init__(self, x: int, y: int):
         """
         The position class is constructed from the x and y coordinate which the
@@ -75,6 +82,9 @@ class Position:
         """
         self._x = x
         self._y = y
+        # Positions are never modified after construction, so the hash can
+        # be computed once up front rather than on every dictionary lookup.
+        self._hash = hash((x, y))
 
     def get_x(self) -> int:
         """Returns the x coordinate of the position."""
@@ -99,8 +109,8 @@ class Position:
             position: Another position to calculate the distance from
                       the current position.
         """
-        dx = abs(self.get_x() - position.get_x())
-        dy = abs(self.get_y() - position.get_y())
+        dx = abs(self._x - position._x)
+        dy = abs(self._y - position._y)
         return dx + dy
 
     def in_range(self, position: "Position", range: int) -> bool:
@@ -143,7 +153,7 @@ class Position:
             A new position representing the current position plus
             the given position.
         """
-        return Position(self._x + position.get_x(), self._y + position.get_y())
+        return Position(self._x + position._x, self._y + position._y)
 
     def __eq__(self, other: object) -> bool:
         """
@@ -161,7 +171,7 @@ class Position:
         # https://www.pythontutorial.net/python-oop/python-__eq__/
         if not isinstance(other, Position):
             return False
-        return self.get_x() == other.get_x() and self.get_y() == other.get_y()
+        return self._x == other._x and self._y == other._y
 
     def __hash__(self) -> int:
         """
@@ -176,7 +186,7 @@ class Position:
         
         Reference: https://stackoverflow.com/questions/17585730/what-does-hash-do-in-python
         """
-        return hash((self.get_x(), self.get_y()))
+        return self._hash
 
     def __repr__(self) -> str:
         """
@@ -191,7 +201,7 @@ class Position:
             >>> Position(12, 21).__repr__()
             'Position(12, 21)'
         """
-        return f"Position({self.get_x()}, {self.get_y()})"
+        return f"Position({self._x}, {self._y})"
 
     def __str__(self) -> str:
         """
@@ -203,6 +213,14 @@ class Position:
         return self.__repr__()
 
 
+# Offsets for each movement direction, shared as positions are immutable.
+_DIR_OFFSETS = {direction: Position(*offset)
+                for direction, offset in DIRECTION_OFFSETS.items()}
+
+# Positions for each offset in OFFSETS, keyed by the offset tuple.
+_OFFSET_POSITIONS = {offset: Position(*offset) for offset in OFFSETS}
+
+
 class GameInterface:
     """
     The GameInterface class is an abstract class that handles the communication
@@ -249,6 +267,10 @@ The value is a string representing the entity.
 """
 
 
+# Matches a single entity character within a line of a map file.
+_MAP_TOKEN = re.compile(r"[^ ]")
+
+
 def load_map(filename: str) -> Tuple[EntityLocations, int]:
     """
     Open and read a map file, converting it into a tuple.
@@ -265,13 +287,17 @@ def load_map(filename: str) -> Tuple[EntityLocations, int]:
         A tuple containing the serialized map and the size of the map.
     """
     with open(filename) as map_file:
-        contents = map_file.readlines()
-
-    result = {}
-    for y, line in enumerate(contents):
-        for x, char in enumerate(line.strip("\n")):
-            if char != " ":
-                result[(x, y)] = char
+        contents = map_file.read().split("\n")
+    # A trailing newline leaves an empty final entry that is not a row.
+    if contents and not contents[-1]:
+        contents.pop()
+
+    # The regex engine skips over the blank tiles of each line in C.
+    result = {
+        (match.start(), y): match.group()
+        for y, line in enumerate(contents)
+        for match in _MAP_TOKEN.finditer(line)
+    }
 
     return result, len(contents)
 
@@ -287,6 +313,8 @@ class Entity:
     zombie is considered a type of entity.
     """
 
+    __slots__ = ()
+
     def step(self, position: Position, game: "Game") -> None:
         """
         The `step` method is called on every entity in the game grid after each
@@ -312,6 +340,9 @@ class Entity:
         
         To indicate that this method needs to be implemented by subclasses,
         this method should raise a NotImplementedError.
+
+        Subclasses also store their character in the DISPLAY class attribute,
+        which performance sensitive code reads instead of calling this method.
         
         Raises:
             NotImplementedError: Whenever this method is called.
@@ -354,6 +385,10 @@ class Player(Entity):
         'P'
     """
 
+    __slots__ = ()
+
+    DISPLAY = PLAYER
+
     def display(self) -> str:
         """
         Return the character used to represent the player entity in a
@@ -361,7 +396,7 @@ class Player(Entity):
         
         A player should be represented by the 'P' character.
         """
-        return PLAYER
+        return self.DISPLAY
 
 
 class Hospital(Entity):
@@ -380,6 +415,10 @@ class Hospital(Entity):
         'H'
     """
 
+    __slots__ = ()
+
+    DISPLAY = HOSPITAL
+
     def display(self) -> str:
         """
         Return the character used to represent the hospital entity in a
@@ -387,7 +426,7 @@ class Hospital(Entity):
         
         A hospital should be represented by the 'H' character.
         """
-        return HOSPITAL
+        return self.DISPLAY
 
 
 class Grid:
@@ -427,7 +466,23 @@ class Grid:
             size: The length and width of the grid.
         """
         self._size = size
-        self._tiles: Dict[Position, Entity] = {}
+        # Tiles are keyed by raw (x, y) tuples rather than Position instances
+        # as tuples hash and compare without any Python level method calls.
+        self._tiles: Dict[Tuple[int, int], Entity] = {}
+        # Row-major mirror of the tiles holding the display character of
+        # each entity, so scans over the grid index a contiguous buffer.
+        self._cells = bytearray(b" " * (size * size))
+        # Number of entities in the grid for each display character, so
+        # checks such as whether any hospital remains are O(1).
+        self._counts = collections.Counter()
+        # Position of the player, so finding the player does not need to
+        # search every tile.
+        self._player_position: Optional[Position] = None
+        # Incremented on every change to the tiles, so the result of
+        # serialize can be reused until the grid is next modified.
+        self._version = 0
+        self._serialized: Dict[Tuple[int, int], str] = {}
+        self._serialized_version = 0
 
     def get_size(self) -> int:
         """Returns the size of the grid."""
@@ -461,8 +516,8 @@ class Grid:
             >>> grid10.in_bounds(Position(9, 10))
             False
         """
-        return (0 <= position.get_x() < self._size
-                and 0 <= position.get_y() < self._size)
+        size = self._size
+        return 0 <= position._x < size and 0 <= position._y < size
 
     def add_entity(self, position: Position, entity: Entity) -> None:
         """
@@ -493,7 +548,46 @@ class Grid:
             >>> grid.get_entity(Position(-1, 0))
         """
         if self.in_bounds(position):
-            self._tiles[position] = entity
+            self._place(position._x, position._y, entity)
+
+    def bulk_add(self, entities: Iterable[Tuple[int, int, Entity]]) -> None:
+        """
+        Place each entity from the given (x, y, entity) tuples on the grid,
+        as add_entity would, writing the tiles directly rather than making
+        a method call and a Position for each one.
+
+        Entities replace any existing entity at their position and those
+        outside the bounds of the grid are not added.
+
+        Parameters:
+            entities: The (x, y) coordinates and entity to place for each
+                      entity to be added.
+
+        Examples:
+            >>> grid = Grid(3)
+            >>> grid.bulk_add([(0, 0, Player()), (2, 1, Hospital()),
+            ...                (3, 0, Hospital())])
+            >>> grid.get_cells()
+            b'P    H   '
+            >>> grid.find_player()
+            Position(0, 0)
+        """
+        size = self._size
+        tiles = self._tiles
+        cells = self._cells
+        counts = self._counts
+        for x, y, entity in entities:
+            if not (0 <= x < size and 0 <= y < size):
+                continue
+            if (x, y) in tiles:
+                self._vacate(x, y)
+            display = entity.DISPLAY
+            tiles[(x, y)] = entity
+            cells[y * size + x] = ord(display)
+            counts[display] += 1
+            if display == PLAYER:
+                self._player_position = Position(x, y)
+        self._version += 1
 
     def remove_entity(self, position: Position) -> None:
         """
@@ -511,7 +605,7 @@ class Grid:
             >>> grid.remove_entity(Position(0, 0))
             >>> grid.get_entity(Position(0, 0))
         """
-        self._tiles.pop(position, None)
+        self._vacate(position._x, position._y)
 
     def get_entity(self, position: Position) -> Optional[Entity]:
         """
@@ -525,7 +619,7 @@ class Grid:
         Parameters:
             position: The (x, y) position in the grid to check for an entity.
         """
-        return self._tiles.get(position)
+        return self._tiles.get((position._x, position._y))
 
     def get_mapping(self) -> Dict[Position, Entity]:
         """
@@ -546,7 +640,8 @@ class Grid:
             >>> grid.get_mapping()
             {Position(0, 0): Player(), Position(3, 3): Hospital()}
         """
-        return self._tiles.copy()
+        return {Position(x, y): entity
+                for (x, y), entity in self._tiles.items()}
 
     def get_entities(self) -> List[Entity]:
         """
@@ -568,6 +663,38 @@ class Grid:
         """
         return list(self._tiles.values())
 
+    def get_cells(self) -> bytes:
+        """
+        Return the display characters of every tile in the grid as a single
+        row-major bytes object, with a space for each empty tile.
+
+        The character for position (x, y) is at index y * size + x.
+        Updating the grid afterwards does not change the returned bytes.
+
+        Examples:
+            >>> grid = Grid(3)
+            >>> grid.add_entity(Position(1, 0), Player())
+            >>> grid.add_entity(Position(2, 2), Hospital())
+            >>> grid.get_cells()
+            b' P      H'
+        """
+        return bytes(self._cells)
+
+    def snapshot_items(self) -> List[Tuple[Tuple[int, int], Entity]]:
+        """
+        Return a list of the ((x, y), entity) pairs in the grid.
+
+        The list is a snapshot, so the grid may be modified while iterating
+        over it.
+
+        Examples:
+            >>> grid = Grid(4)
+            >>> grid.add_entity(Position(1, 2), Player())
+            >>> grid.snapshot_items()
+            [((1, 2), Player())]
+        """
+        return list(self._tiles.items())
+
     def move_entity(self, start: Position, end: Position) -> None:
         """
         Move an entity from the given start position to the given end position.
@@ -595,11 +722,91 @@ class Grid:
         """
         if start == end:
             return
-        if self.in_bounds(start) and self.in_bounds(end):
-            entity = self.get_entity(start)
+        size = self._size
+        if (0 <= start._x < size and 0 <= start._y < size
+                and 0 <= end._x < size and 0 <= end._y < size):
+            entity = self._vacate(start._x, start._y)
             if entity is not None:
-                self._tiles[end] = entity
-                del self._tiles[start]
+                self._place(end._x, end._y, entity)
+
+    def count_entities(self, display: str) -> int:
+        """
+        Return how many entities in the grid are represented by the given
+        display character.
+
+        Examples:
+            >>> grid = Grid(5)
+            >>> grid.add_entity(Position(0, 0), Hospital())
+            >>> grid.add_entity(Position(4, 4), Hospital())
+            >>> grid.count_entities(HOSPITAL)
+            2
+            >>> grid.count_entities(PLAYER)
+            0
+        """
+        return self._counts[display]
+
+    def scan_direction(self, start: Position,
+                       offset: Position) -> Optional[Position]:
+        """
+        Return the position of the first non-empty tile found by stepping
+        from start (exclusive) by offset until the walk leaves the grid, or
+        None if every tile along the way is empty.
+
+        Examples:
+            >>> grid = Grid(5)
+            >>> grid.add_entity(Position(1, 2), Zombie())
+            >>> grid.add_entity(Position(4, 2), Hospital())
+            >>> grid.scan_direction(Position(2, 2), Position(-1, 0))
+            Position(1, 2)
+            >>> grid.scan_direction(Position(2, 2), Position(1, 0))
+            Position(4, 2)
+            >>> grid.scan_direction(Position(2, 2), Position(0, 1)) is None
+            True
+            >>> grid.scan_direction(Position(3, 0), Position(-1, 1))
+            Position(1, 2)
+        """
+        x, y = start._x, start._y
+        dx, dy = offset._x, offset._y
+        size = self._size
+
+        # Bound the walk up front, so the tiles along it can be taken from
+        # the flat cell buffer as one slice and searched in C.
+        steps = min(self._steps_to_edge(x, dx), self._steps_to_edge(y, dy))
+        if steps == 0:
+            return None
+
+        first = (y + dy) * size + x + dx
+        stride = dy * size + dx
+        if stride == 0:
+            # A zero offset only ever looks at the start tile itself.
+            line = self._cells[first:first + 1]
+        else:
+            end = first + stride * steps
+            line = self._cells[first:end if end >= 0 else None:stride]
+
+        distance = len(line) - len(line.lstrip(b" ")) + 1
+        if distance > len(line):
+            return None
+        return Position(x + dx * distance, y + dy * distance)
+
+    def _steps_to_edge(self, coordinate: int, delta: int) -> int:
+        """
+        Return how many steps of delta can be taken from coordinate before
+        leaving the range [0, size), stopping at the first step outside it.
+
+        A delta of zero never leaves the range if it starts inside it, in
+        which case size is returned so that the other axis bounds the walk.
+        """
+        size = self._size
+        if delta > 0:
+            if coordinate + delta < 0:
+                return 0
+            return max(0, (size - 1 - coordinate) // delta)
+        if delta < 0:
+            if coordinate + delta >= size:
+                return 0
+            return max(0, coordinate // -delta)
+        return size if 0 <= coordinate < size else 0
 
     def find_player(self) -> Optional[Position]:
         """
@@ -616,10 +823,13 @@ class Grid:
             >>> grid.find_player()
             Position(4, 6)
         """
-        for position, entity in self._tiles.items():
-            if entity.display() == PLAYER:
-                return position
-        return None
+        if self._player_position is None and self._counts[PLAYER]:
+            # The tracked player was removed while another player remains.
+            for (x, y), entity in self._tiles.items():
+                if entity.DISPLAY == PLAYER:
+                    self._player_position = Position(x, y)
+                    break
+        return self._player_position
 
     def serialize(self) -> Dict[Tuple[int, int], str]:
         """
@@ -632,6 +842,10 @@ class Grid:
         
         Only positions that have an entity should exist in the dictionary.
 
+        The same dictionary is returned until the grid is next modified, so
+        it should be treated as read-only. Modifying the grid builds a new
+        dictionary rather than changing one that was previously returned.
+
         Examples:
             >>> grid = Grid(50)
             >>> grid.add_entity(Position(3, 8), Player())
@@ -639,13 +853,44 @@ class Grid:
             >>> grid.serialize()
             {(3, 8): 'P', (3, 20): 'H'}
         """
-        serialized = {}
+        if self._serialized_version != self._version:
+            self._serialized = {pair: entity.DISPLAY
+                                for pair, entity in self._tiles.items()}
+            self._serialized_version = self._version
+        return self._serialized
 
-        for position, entity in self._tiles.items():
-            pair = (position.get_x(), position.get_y())
-            serialized[pair] = entity.display()
+    def _place(self, x: int, y: int, entity: Entity) -> None:
+        """
+        Store an entity at the in bounds (x, y) position, replacing any
+        existing entity, and update the bookkeeping mirrored from the tiles.
+        """
+        self._vacate(x, y)
+        self._version += 1
+        display = entity.DISPLAY
+        self._tiles[(x, y)] = entity
+        self._cells[y * self._size + x] = ord(display)
+        self._counts[display] += 1
+        if display == PLAYER:
+            self._player_position = Position(x, y)
 
-        return serialized
+    def _vacate(self, x: int, y: int) -> Optional[Entity]:
+        """
+        Remove and return the entity at the (x, y) position, if any, and
+        update the bookkeeping mirrored from the tiles.
+        """
+        entity = self._tiles.pop((x, y), None)
+        if entity is not None:
+            self._version += 1
+            self._cells[y * self._size + x] = EMPTY_CELL
+            display = entity.DISPLAY
+            self._counts[display] -= 1
+            if not self._counts[display]:
+                del self._counts[display]
+
+            player = self._player_position
+            if player is not None and player._x == x and player._y == y:
+                self._player_position = None
+        return entity
 
 
 class MapLoader:
@@ -677,8 +922,9 @@ class MapLoader:
         mapping, size = load_map(filename)
 
         grid = Grid(size)
-        for position, entity in mapping.items():
-            grid.add_entity(Position(*position), self.create_entity(entity))
+        create_entity = self.create_entity
+        grid.bulk_add((x, y, create_entity(token))
+                      for (x, y), token in mapping.items())
 
         return grid
 
@@ -708,6 +954,12 @@ class BasicMapLoader(MapLoader):
     * Hospital
     """
 
+    # Players and hospitals hold no state, so a single shared instance of
+    # each is placed on every matching tile rather than one per tile.
+    _PLAYER = Player()
+    _HOSPITAL = Hospital()
+    _SHARED = {PLAYER: _PLAYER, HOSPITAL: _HOSPITAL}
+
     def create_entity(self, token: str) -> Entity:
         """
         Create and return a new instance of the Entity class based on the
@@ -723,10 +975,9 @@ class BasicMapLoader(MapLoader):
         Parameters:
             token: Character representing the Entity subtype.
         """
-        if token == PLAYER:
-            return Player()
-        elif token == HOSPITAL:
-            return Hospital()
+        entity = self._SHARED.get(token)
+        if entity is not None:
+            return entity
 
         raise ValueError(f"Unrecognised entity '{token}' in map file.")
 
@@ -786,8 +1037,11 @@ class Game:
 
         Note: Do not call this method in the `move_player` method.
         """
-        for position, entity in self._grid.get_mapping().items():
-            entity.step(position, self)
+        for (x, y), entity in self._grid.snapshot_items():
+            # Skip entities which inherit the do-nothing Entity.step, such as
+            # hospitals and pickups, to avoid a call and Position per tile.
+            if type(entity).step is not Entity.step:
+                entity.step(Position(x, y), self)
         self._steps += 1
 
     def get_steps(self) -> int:
@@ -814,11 +1068,29 @@ class Game:
             offset: A position to add to the player's current position
                     to produce the player's new desired position.
         """
-        if self._player_position is not None:
-            destination = self._player_position.add(offset)
-            if self._grid.in_bounds(destination):
-                self._grid.move_entity(self._player_position, destination)
-                self._player_position = destination
+        destination = self._player_destination(offset)
+        if destination is not None:
+            self._grid.move_entity(self._player_position, destination)
+            self._player_position = destination
+
+    def _player_destination(self, offset: Position) -> Optional[Position]:
+        """
+        Return the position the player would reach by moving by the given
+        offset, or None if there is no player or that position is outside
+        the bounds of the grid.
+
+        The bounds are checked on the raw coordinates so that no Position is
+        created for a move that cannot happen.
+        """
+        position = self._player_position
+        if position is None:
+            return None
+
+        x, y = position._x + offset._x, position._y + offset._y
+        size = self._grid.get_size()
+        if 0 <= x < size and 0 <= y < size:
+            return Position(x, y)
+        return None
 
     def direction_to_offset(self, direction: str) -> Optional[Position]:
         """
@@ -846,16 +1118,7 @@ class Game:
             >>> game.direction_to_offset("N")
             >>> game.direction_to_offset("that way!")
         """
-        if direction == UP:
-            return Position(0, -1)
-        elif direction == DOWN:
-            return Position(0, 1)
-        elif direction == LEFT:
-            return Position(-1, 0)
-        elif direction == RIGHT:
-            return Position(1, 0)
-        else:
-            return None
+        return _DIR_OFFSETS.get(direction)
 
     def has_won(self) -> bool:
         """
@@ -864,7 +1127,7 @@ class Game:
         The player wins the game by stepping onto the hospital. When the player
         steps on the hospital, there will be no hospital entity in the grid.
         """
-        return HOSPITAL not in self._grid.serialize().values()
+        return self._grid.count_entities(HOSPITAL) == 0
 
     def has_lost(self) -> bool:
         """
@@ -894,6 +1157,7 @@ class TextInterface(GameInterface):
             size (int): The size of the game to be displayed and played.
         """
         self._size = size
+        self._border = BORDER * (size + 2) + "\n"
 
     def draw(self, game: Game) -> None:
         """
@@ -917,16 +1181,37 @@ class TextInterface(GameInterface):
             #    #
             ######
         """
-        mapping = game.get_grid().serialize()
+        # Write the whole frame at once rather than with a print per row.
+        sys.stdout.write(self._render(game))
+        sys.stdout.flush()
+
+    def _render(self, game: Game) -> str:
+        """
+        Return the text drawn for the given game's grid, including the
+        surrounding border, with each line ending in a newline.
+
+        Parameters:
+            game: An instance of the game class that is to be rendered.
+        """
+        grid = game.get_grid()
         size = self._size
-        print(BORDER * (size + 2))
-        for y in range(size):
-            print(BORDER, end="")
-            for x in range(size):
-                tile = mapping.get((x, y), " ") or " "
-                print(tile, end="")
-            print(BORDER)
-        print(BORDER * (size + 2))
+        if grid.get_size() == size:
+            # The rows of the cell buffer are exactly the rows to draw.
+            cells = grid.get_cells()
+            rows = [
+                "".join((BORDER, cells[y * size:(y + 1) * size].decode(),
+                         BORDER, "\n"))
+                for y in range(size)
+            ]
+        else:
+            # A grid of another size is cropped or padded to the interface.
+            mapping = grid.serialize()
+            rows = [
+                "".join((BORDER, *(mapping.get((x, y), " ") or " "
+                                   for x in range(size)), BORDER, "\n"))
+                for y in range(size)
+            ]
+        return "".join((self._border, *rows, self._border))
 
     def play(self, game: Game) -> None:
         """
@@ -940,22 +1225,25 @@ class TextInterface(GameInterface):
         Parameters:
             game: The game to start playing.
         """
-        won_game = False
-        lost_game = False
+        # Resolve the methods used every turn once, before the loop.
+        draw = self.draw
+        handle_action = self.handle_action
+        has_won = game.has_won
+        has_lost = game.has_lost
 
-        while not won_game and not lost_game:
-            self.draw(game)
+        while True:
+            draw(game)
 
             action = input(ACTION_PROMPT)
-            self.handle_action(game, action)
+            handle_action(game, action)
 
-            if game.has_won():
+            if has_won():
                 print(WIN_MESSAGE)
-                won_game = True
+                break
 
-            if not won_game and game.has_lost():
+            if has_lost():
                 print(LOSE_MESSAGE)
-                lost_game = True
+                break
 
     def handle_action(self, game: Game, action: str) -> None:
         """
@@ -975,11 +1263,10 @@ class TextInterface(GameInterface):
             game: The game that is currently being played.
             action: An action entered by the player during the game loop.
         """
-        if action in DIRECTIONS:
-            offset = game.direction_to_offset(action)
-
-            if offset is not None:
-                game.move_player(offset)
+        # A single lookup both recognises a direction and gives its offset.
+        offset = _DIR_OFFSETS.get(action)
+        if offset is not None:
+            game.move_player(offset)
 
         game.step()
 
@@ -1002,6 +1289,8 @@ class VulnerablePlayer(Player):
         True
     """
 
+    __slots__ = ('_infected',)
+
     def __init__(self):
         """
         When an object of the VulnerablePlayer class is constructed,
@@ -1030,11 +1319,15 @@ class Zombie(Entity):
     i.e. the zombie moves during each _step_ event.
     """
 
+    __slots__ = ()
+
+    DISPLAY = ZOMBIE
+
     def _directions(
             self, position: Position, game: Game
-    ) -> List[Tuple[int, int]]:
+    ) -> Sequence[Tuple[int, int]]:
         """
-        Returns the list of offsets sorted by the order of directions
+        Returns the sequence of offsets sorted by the order of directions
         prioritised by this zombie
             
         Parameters:
@@ -1079,12 +1372,11 @@ class Zombie(Entity):
                       is triggered.
             game: The current game being played.
         """
+        grid = game.get_grid()
         for direction in self._directions(position, game):
-            destination = position.add(
-                Position(*direction)  # pylint: disable=(not-an-iterable)
-            )
+            destination = position.add(_OFFSET_POSITIONS[direction])
 
-            destination_entity = game.get_grid().get_entity(destination)
+            destination_entity = grid.get_entity(destination)
             if destination_entity is not None:
                 # The commented out line is how students are expected to
                 # implement it, however, we gotta make the type checker happy.
@@ -1095,8 +1387,8 @@ class Zombie(Entity):
 
                 continue
 
-            if game.get_grid().in_bounds(destination):
-                game.get_grid().move_entity(position, destination)
+            if grid.in_bounds(destination):
+                grid.move_entity(position, destination)
                 break
 
     def display(self) -> str:
@@ -1106,7 +1398,7 @@ class Zombie(Entity):
         
         A zombie should be represented by the 'Z' character.
         """
-        return ZOMBIE
+        return self.DISPLAY
 
 
 class IntermediateGame(Game):
@@ -1149,11 +1441,17 @@ class IntermediateMapLoader(BasicMapLoader):
     * Zombie
     """
 
+    # Entity class to construct for each token, the tokens not found here
+    # are handled by BasicMapLoader.
+    _FACTORY = {
+        ZOMBIE: Zombie,
+        PLAYER: VulnerablePlayer,
+    }
+
     def create_entity(self, token: str) -> Entity:
-        if token == ZOMBIE:
-            return Zombie()
-        elif token == PLAYER:
-            return VulnerablePlayer()
+        factory = self._FACTORY.get(token)
+        if factory is not None:
+            return factory()
         return super().create_entity(token)
 
 
@@ -1164,6 +1462,10 @@ class TrackingZombie(Zombie):
     to see the player and move towards them.
     """
 
+    __slots__ = ()
+
+    DISPLAY = TRACKING_ZOMBIE
+
     def _directions(
             self, position: Position, game: Game
     ) -> List[Tuple[int, int]]:
@@ -1171,12 +1473,14 @@ class TrackingZombie(Zombie):
         if target is None:
             return []  # Should never happen.
 
-        def distance(direction):
-            new_position = position.add(Position(*direction))
-            return new_position.distance(target), direction
-
-        best_directions = sorted(OFFSETS, key=distance)
-        return best_directions
+        # Build each (distance, direction) sort key once from plain ints,
+        # ties are broken by comparing the direction tuples.
+        dx_target = target._x - position._x
+        dy_target = target._y - position._y
+        keyed = [(abs(dx_target - dx) + abs(dy_target - dy), (dx, dy))
+                 for dx, dy in OFFSETS]
+        keyed.sort()
+        return [direction for _, direction in keyed]
 
     def step(self, position: Position, game: Game) -> None:
         """
@@ -1232,7 +1536,7 @@ class TrackingZombie(Zombie):
         
         A tracking zombie should be represented by the 'T' character.
         """
-        return TRACKING_ZOMBIE
+        return self.DISPLAY
 
 
 class Pickup(Entity):
@@ -1243,6 +1547,8 @@ class Pickup(Entity):
     The Pickup class is an abstract class.
     """
 
+    __slots__ = ('_lifetime', '_using')
+
     def __init__(self):
         """
         When a Pickup entity is created, the lifetime of the entity should
@@ -1278,6 +1584,13 @@ class Pickup(Entity):
     def set_lifetime(self, lifetime):
         self._lifetime = lifetime
 
+    def is_expired(self) -> bool:
+        """
+        Return whether this pickup has used up its lifetime and should be
+        removed from the player's inventory.
+        """
+        return self.get_lifetime() <= 0
+
     def hold(self) -> None:
         """
         The `hold` method is called on every pickup entity that the player
@@ -1301,13 +1614,13 @@ class Pickup(Entity):
         """
         self._using = not self._using
 
-    # def __repr__(self) -> str:
-    #     """
-    #     Return a string that represents the entity, the representation
-    #     contains the type of the pickup entity and the amount of
-    #     remaining steps.
-    #     """
-    #     return f"{self.__class__.__name__}({self.get_lifetime()})"
+    def __repr__(self) -> str:
+        """
+        Return a string that represents the entity, the representation
+        contains the type of the pickup entity and the amount of
+        remaining steps.
+        """
+        return f"{self.__class__.__name__}({self.get_lifetime()})"
 
 
 class Time_machine(Pickup):
@@ -1319,6 +1632,10 @@ class Time_machine(Pickup):
      travel back 5 steps.
     """
 
+    __slots__ = ()
+
+    DISPLAY = TIME_MACHINE
+
     def get_lifetime(self):
         return ''
 
@@ -1328,8 +1645,12 @@ class Time_machine(Pickup):
     def hold(self):
         self._lifetime = ''
 
+    def is_expired(self) -> bool:
+        """A time machine has an infinite lifetime, so it never expires."""
+        return False
+
     def display(self) -> str:
-        return TIME_MACHINE
+        return self.DISPLAY
 
 
 class Garlic(Pickup):
@@ -1340,6 +1661,10 @@ class Garlic(Pickup):
     be infected by a zombie.
     """
 
+    __slots__ = ()
+
+    DISPLAY = GARLIC
+
     def get_durability(self) -> int:
         """
         Return the durability of a garlic.
@@ -1355,7 +1680,7 @@ class Garlic(Pickup):
         
         A garlic should be represented by the 'G' character.
         """
-        return GARLIC
+        return self.DISPLAY
 
 
 class Crossbow(Pickup):
@@ -1367,6 +1692,10 @@ class Crossbow(Pickup):
     given direction, removing the first zombie in that direction.
     """
 
+    __slots__ = ()
+
+    DISPLAY = CROSSBOW
+
     def get_durability(self) -> int:
         """
         Return the durability of a crossbow.
@@ -1381,7 +1710,7 @@ class Crossbow(Pickup):
         a text-based grid.
         A crossbow should be represented by the 'C' character.
         """
-        return CROSSBOW
+        return self.DISPLAY
 
 
 class Inventory:
@@ -1419,11 +1748,17 @@ class Inventory:
         []
     """
 
+    __slots__ = ('_items', '_by_display')
+
     def __init__(self):
         """
         When an inventory is constructed, it should not contain any items.
         """
         self._items = []
+        # The same items grouped by display character, so checks for a
+        # given kind of pickup only look at items of that kind.
+        self._by_display: Dict[str, List[Pickup]] = \
+            collections.defaultdict(list)
 
     def step(self) -> None:
         """
@@ -1434,15 +1769,14 @@ class Inventory:
         within the inventory should decrease. Any items in the inventory that 
         have exceeded their lifetime should be removed.
         """
-        new_items = []
+        kept = []
         for item in self._items:
             item.hold()
-            try:
-                if item.get_lifetime() > 0:
-                    new_items.append(item)
-            except TypeError:
-                new_items.append(item)
-        self._items = new_items
+            if item.is_expired():
+                self._by_display[item.DISPLAY].remove(item)
+            else:
+                kept.append(item)
+        self._items = kept
 
     def add_item(self, item: Pickup) -> None:
         """
@@ -1452,6 +1786,7 @@ class Inventory:
             item: The pickup entity to add to the inventory.
         """
         self._items.append(item)
+        self._by_display[item.DISPLAY].append(item)
 
     def get_items(self) -> List[Pickup]:
         """
@@ -1463,14 +1798,16 @@ class Inventory:
         return self._items[:]
 
     def remove_time_machine(self):
-        for item in self.get_items():
-            if item.display() == TIME_MACHINE and item.is_active():
+        time_machines = self._by_display[TIME_MACHINE]
+        for item in time_machines[:]:
+            if item.is_active():
+                time_machines.remove(item)
                 self._items.remove(item)
 
     def serialize(self):
         serial = {}
         for item in self.get_items():
-            serial[item.display()] = item.get_lifetime()
+            serial[item.DISPLAY] = item.get_lifetime()
         return serial
 
     def contains(self, pickup_id: str) -> bool:
@@ -1486,18 +1823,15 @@ class Inventory:
             >>> inventory.contains("G")
             True
         """
-        for item in self._items:
-            if item.display() == pickup_id:
-                return True
-        return False
+        return bool(self._by_display.get(pickup_id))
 
     def has_active(self, pickup_id: str) -> bool:
         """
         Returns whether the inventory contains any active entities of the
         corresponding pickup_id type.
         """
-        for item in self._items:
-            if item.display() == pickup_id and item.is_active():
+        for item in self._by_display.get(pickup_id, ()):
+            if item.is_active():
                 return True
         return False
 
@@ -1519,24 +1853,18 @@ class HoldingPlayer(VulnerablePlayer):
     In particular, a holding player will now keep an inventory.
     """
 
+    __slots__ = ('_inventory', '_past_steps')
+
     def __init__(self):
         super().__init__()
         self._inventory = Inventory()
-        self._past_steps = []
+        # Only the last five positions are kept, the step which should be
+        # chosen is self._past_steps[0].
+        self._past_steps = collections.deque(maxlen=5)
 
     def store_positions(self, game: Game):
         position = game.get_grid().find_player()
-        if len(self._past_steps) < 5:
-            # In this case, just restart the game.
-            self._past_steps.append(
-                (position.get_x(), position.get_y()))
-        else:
-            # In this way, the step which should be choose is
-            # self._past_steps[0]
-            for i in range(4):
-                self._past_steps[i] = self._past_steps[i + 1]
-            self._past_steps[4] = (
-                position.get_x(), position.get_y())
+        self._past_steps.append((position.get_x(), position.get_y()))
 
     def get_inventory(self) -> Inventory:
         """
@@ -1582,18 +1910,21 @@ class AdvancedGame(IntermediateGame):
             offset: A position to add to the player's current position
                     to produce the player's new desired position.
         """
-        if self._player_position is not None:
-            destination = self._player_position.add(offset)
-            if self._grid.in_bounds(destination):
-                entity = self._grid.get_entity(destination)
-                if entity is not None and isinstance(entity, Pickup):
-                    player = self.get_player()
-                    if isinstance(player, HoldingPlayer):
-                        player.get_inventory().add_item(entity)
-                        self.get_grid().remove_entity(destination)
-                elif entity is not None and isinstance(entity, Zombie):
-                    return
-        super().move_player(offset)
+        destination = self._player_destination(offset)
+        if destination is None:
+            return
+
+        entity = self._grid.get_entity(destination)
+        if entity is not None and isinstance(entity, Pickup):
+            player = self.get_player()
+            if isinstance(player, HoldingPlayer):
+                player.get_inventory().add_item(entity)
+                self.get_grid().remove_entity(destination)
+        elif entity is not None and isinstance(entity, Zombie):
+            return
+
+        self._grid.move_entity(self._player_position, destination)
+        self._player_position = destination
 
 
 class AdvancedMapLoader(IntermediateMapLoader):
@@ -1612,22 +1943,20 @@ class AdvancedMapLoader(IntermediateMapLoader):
     * Crossbow
     """
 
-    def create_entity(self, token: str) -> Entity:
-        if token == PLAYER:
-            return HoldingPlayer()
-        elif token == TRACKING_ZOMBIE:
-            return TrackingZombie()
-        elif token == GARLIC:
-            return Garlic()
-        elif token == CROSSBOW:
-            return Crossbow()
-        elif token == TIME_MACHINE:
-            return Time_machine()
-        return super().create_entity(token)
+    # Extends the IntermediateMapLoader table, which create_entity looks up.
+    _FACTORY = {
+        **IntermediateMapLoader._FACTORY,
+        PLAYER: HoldingPlayer,
+        TRACKING_ZOMBIE: TrackingZombie,
+        GARLIC: Garlic,
+        CROSSBOW: Crossbow,
+        TIME_MACHINE: Time_machine,
+    }
 
     def load_game(self, grid: Grid, mapping):
-        for position, entity in mapping.items():
-            grid.add_entity(Position(*position), self.create_entity(entity))
+        create_entity = self.create_entity
+        grid.bulk_add((x, y, create_entity(token))
+                      for (x, y), token in mapping.items())
         return grid
 
 
@@ -1682,15 +2011,18 @@ class AdvancedTextInterface(TextInterface):
             Garlic(10)
             Crossbow(5)
         """
-        super().draw(game)
+        frame = self._render(game)
 
         player = game.get_player()
         if isinstance(player, HoldingPlayer):
             inventory = player.get_inventory().get_items()
             if len(inventory) > 0:
-                print(HOLDING_MESSAGE)
-                for item in inventory:
-                    print(item)
+                lines = [HOLDING_MESSAGE, *map(repr, inventory)]
+                frame += "\n".join(lines) + "\n"
+
+        # The grid and the inventory are written together in one call.
+        sys.stdout.write(frame)
+        sys.stdout.flush()
 
     def handle_action(self, game: Game, action: str) -> None:
         """
@@ -1733,10 +2065,10 @@ class AdvancedTextInterface(TextInterface):
                 direction = input(FIRE_PROMPT)
 
                 # Fire the weapon in the indicated direction, if possible.
-                if direction in DIRECTIONS:
+                offset = _DIR_OFFSETS.get(direction)
+                if offset is not None:
                     start = game.get_grid().find_player()
-                    offset = game.direction_to_offset(direction)
-                    if start is None or offset is None:
+                    if start is None:
                         return  # Should never happen.
 
                     # Find the first entity in the direction player fired.
@@ -1745,7 +2077,7 @@ class AdvancedTextInterface(TextInterface):
                     )
 
                     # If the entity is a zombie, kill it.
-                    if first is not None and first[1].display() in ZOMBIES:
+                    if first is not None and first[1].DISPLAY in ZOMBIES:
                         position, entity = first
                         game.get_grid().remove_entity(position)
                     else:
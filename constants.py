@@ -28,6 +28,8 @@ DOWN = "S"
 RIGHT = "D"
 DIRECTIONS = (UP, LEFT, DOWN, RIGHT)
 FIRE = "F"
+# (x, y) offset of one step in each direction.
+DIRECTION_OFFSETS = {UP: (0, -1), LEFT: (-1, 0), DOWN: (0, 1), RIGHT: (1, 0)}
 
 # Direction offsets, see random_directions docstring for more details.
 OFFSETS = [(-1, 0), (0, 1), (0, -1), (1, 0)]    # W, S, N, E
@@ -82,6 +84,10 @@ IMAGES = {
 
 BANNER_HEIGHT = 100
 ARROWS_TO_DIRECTIONS = {'Left':LEFT, 'Right':RIGHT, 'Up':UP, 'Down':DOWN}
+ARROWS_TO_OFFSETS = {
+	arrow: DIRECTION_OFFSETS[direction]
+	for arrow, direction in ARROWS_TO_DIRECTIONS.items()
+}
 
 HIGH_SCORES_FILE = 'high_scores.txt'
 MAX_ALLOWED_HIGH_SCORES = 3
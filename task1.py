@@ -1,9 +1,15 @@
+import time
 import tkinter as tk
 from tkinter import messagebox, simpledialog
 from a2 import *
 from constants import *
 
 
+# Firing offset for each arrow key, shared as positions are immutable.
+_ARROW_OFFSETS = {arrow: Position(*offset)
+                  for arrow, offset in ARROWS_TO_OFFSETS.items()}
+
+
 class AbstractGrid(tk.Canvas):
     """
     AbstractGrid is an abstract view class which inherits from tk.Canvas
@@ -64,7 +70,7 @@ class AbstractGrid(tk.Canvas):
             text: Content to be shown at the center of cell.
         """
         center = self.get_position_center(position)
-        self.create_text(center[0], center[1], text=text)
+        return self.create_text(center[0], center[1], text=text)
 
 
 class BasicMap(AbstractGrid):
@@ -84,18 +90,39 @@ class BasicMap(AbstractGrid):
                          height=size * CELL_SIZE, bg=MAP_BACKGROUND_COLOUR)
 
         self.config(width=size * CELL_SIZE, height=size * CELL_SIZE)
-
-    def get_bbox(self, position):
+        # Bounding box and center of every cell, worked out once as they are
+        # needed for each entity drawn.
+        self._bboxes = {(x, y): self._cell_bbox((x, y))
+                        for x in range(size) for y in range(size)}
+        self._centers = {position: ((bbox[0] + bbox[2]) / 2,
+                                    (bbox[1] + bbox[3]) / 2)
+                         for position, bbox in self._bboxes.items()}
+        self.clear()
+
+    @staticmethod
+    def _cell_bbox(position):
         (x, y) = position
         return x * CELL_SIZE, y * CELL_SIZE, (x + 1) * CELL_SIZE, (
                 y + 1) * CELL_SIZE
 
+    def get_bbox(self, position):
+        bbox = self._bboxes.get(position)
+        if bbox is None:
+            bbox = self._cell_bbox(position)
+        return bbox
+
+    def get_position_center(self, position):
+        center = self._centers.get(position)
+        if center is None:
+            center = super().get_position_center(position)
+        return center
+
     def annotate_position(self, position, text):
         center = self.get_position_center(position)
         if text in [HOSPITAL, PLAYER]:
-            self.create_text(center[0], center[1], text=text, fill='white')
-        else:
-            self.create_text(center[0], center[1], text=text)
+            return self.create_text(center[0], center[1], text=text,
+                                    fill='white')
+        return self.create_text(center[0], center[1], text=text)
 
     def draw_entity(self, position, tile_type):
         """
@@ -105,11 +132,70 @@ class BasicMap(AbstractGrid):
             position: (row, column) position.
             tile_type: A string which represents an entity.
 
+        Returns the ids of the canvas items that were created.
+        """
+        x_min, y_min, x_max, y_max = self.get_bbox(position)
+        rectangle = self.create_rectangle(x_min, y_min, x_max, y_max,
+                                          fill=ENTITY_COLOURS[tile_type])
+        return rectangle, self.annotate_position(position, text=tile_type)
+
+    def draw_background(self):
+        """
+        Draws whatever lies beneath the entities. The plain map has nothing
+        to draw, as the canvas background colour fills it.
+        """
+        pass
+
+    def clear(self):
+        """
+        Removes everything drawn on the map, so that the next redraw draws
+        the whole map again.
+        """
+        self.delete(tk.ALL)
+        # Tile type and canvas item ids of each drawn entity, by position.
+        self._drawn = {}
+        self._item_ids = {}
+        self._background_drawn = False
+
+    def set_entity(self, position, tile_type):
+        """
+        Shows the entity with tile type at a position that currently shows
+        no entity.
+        """
+        self._item_ids[position] = self.draw_entity(position, tile_type)
+
+    def erase_entity(self, position):
+        """
+        Stops showing the entity at the given position.
+        """
+        self.delete(*self._item_ids.pop(position))
+
+    def redraw(self, serial):
+        """
+        Brings the map in line with the given serialized grid, only erasing
+        and redrawing the positions whose entity has changed since the last
+        redraw.
+
+        Parameters:
+            serial: Mapping of (row, column) positions to tile types, as
+                    returned by Grid.serialize.
         """
-        pixel = self.get_bbox(position)
-        self.create_rectangle(pixel[0], pixel[1], pixel[2],
-                              pixel[3], fill=ENTITY_COLOURS[tile_type])
-        self.annotate_position(position, text=tile_type)
+        if not self._background_drawn:
+            self.draw_background()
+            self._background_drawn = True
+
+        drawn = self._drawn
+        stale = [position for position, tile_type in drawn.items()
+                 if serial.get(position) != tile_type]
+        for position in stale:
+            del drawn[position]
+            self.erase_entity(position)
+
+        set_entity = self.set_entity
+        for position, tile_type in serial.items():
+            if position not in drawn:
+                drawn[position] = tile_type
+                set_entity(position, tile_type)
 
 
 class InventoryView(AbstractGrid):
@@ -128,6 +214,12 @@ class InventoryView(AbstractGrid):
         super().__init__(master, rows, 2, INVENTORY_WIDTH,
                          MAP_HEIGHT, bg=LIGHT_PURPLE)
         self.config(width=INVENTORY_WIDTH, height=rows * CELL_SIZE)
+        # Each of the two columns is half the inventory wide, in whole pixels.
+        self._column_width = INVENTORY_WIDTH // 2
+        # Canvas item ids of the label and of each item row, as
+        # (background, name, lifetime), created once and then reconfigured.
+        self._label = None
+        self._rows = []
 
     def get_bbox(self, position):
         """
@@ -148,11 +240,12 @@ class InventoryView(AbstractGrid):
         Parameters:
               pixel: (x, y) pixel position (in graphics units)
         """
-        return pixel[0] // (INVENTORY_WIDTH / 2), pixel[1] // CELL_SIZE
+        return pixel[0] // self._column_width, pixel[1] // CELL_SIZE
 
     def annotate_position(self, position, text):
         center = self.get_position_center(position)
-        self.create_text(center[0], center[1], text=text, font=('Times', '15'))
+        return self.create_text(center[0], center[1], text=text,
+                                font=('Times', '15'))
 
     def draw(self, inventory):
         """
@@ -162,37 +255,55 @@ class InventoryView(AbstractGrid):
         Parameters:
             inventory: Inventory instance which belongs to a player.
         """
-        self.delete(tk.ALL)
-        # draw label
         # draw label text
-        self.annotate_position((0.5, 0), text='Inventory')
+        if self._label is None:
+            self._label = self.annotate_position((0.5, 0), text='Inventory')
+
+        # Rows are only ever added, rows without an item are hidden.
+        items = inventory.get_items()
+        while len(self._rows) < len(items):
+            self._rows.append(self._create_row(len(self._rows) + 1))
+
         # draw current items
-        row = 1
         SPACE = "    "
-        for item in inventory.get_items():
+        for (background, name, lifetime), item in zip(self._rows, items):
             if item.is_active():
-                # draw item background
-                self.create_rectangle((0, row * CELL_SIZE, INVENTORY_WIDTH,
-                                       (row + 1) * CELL_SIZE),
-                                      fill=DARKEST_PURPLE)
-
-                # annotate item name and lifetime
-                center_item = self.get_position_center((0, row))
-                self.create_text(center_item[0], center_item[1],
-                                 text=SPACE + item.__class__.__name__,
-                                 fill='white', font=('Times', '15'))
-
-                center_lifetime = self.get_position_center((1, row))
-                self.create_text(center_lifetime[0], center_lifetime[1],
-                                 text=item.get_lifetime(), fill='white',
-                                 font=('Times', '15'))
-                row += 1
+                # item background with white text on top
+                self.itemconfigure(background, state=tk.NORMAL)
+                colour = 'white'
             else:
-                self.annotate_position((0, row),
-                                       text=SPACE + item.__class__.__name__)
+                self.itemconfigure(background, state=tk.HIDDEN)
+                colour = 'black'
 
-                self.annotate_position((1, row), text=item.get_lifetime())
-                row += 1
+            # annotate item name and lifetime
+            self.itemconfigure(name, text=SPACE + item.__class__.__name__,
+                               fill=colour, state=tk.NORMAL)
+            self.itemconfigure(lifetime, text=item.get_lifetime(),
+                               fill=colour, state=tk.NORMAL)
+
+        for row in self._rows[len(items):]:
+            for item_id in row:
+                self.itemconfigure(item_id, state=tk.HIDDEN)
+
+    def _create_row(self, row):
+        """
+        Creates the hidden canvas items used to show an item in the given
+        row, returning their ids as (background, name, lifetime).
+
+        Parameters:
+            row: The row of the inventory view, starting from 1 below the
+                 label.
+        """
+        background = self.create_rectangle((0, row * CELL_SIZE,
+                                            INVENTORY_WIDTH,
+                                            (row + 1) * CELL_SIZE),
+                                           fill=DARKEST_PURPLE,
+                                           state=tk.HIDDEN)
+        name = self.annotate_position((0, row), text='')
+        lifetime = self.annotate_position((1, row), text='')
+        self.itemconfigure(name, state=tk.HIDDEN)
+        self.itemconfigure(lifetime, state=tk.HIDDEN)
+        return background, name, lifetime
 
     def toggle_item_activation(self, pixel, inventory):
         """
@@ -317,20 +428,25 @@ class BasicGraphicalInterface:
                  of the player within the grid.
         """
         key = event.char.upper()
-        inventory = game.get_player().get_inventory()
-        if key in [UP, LEFT, RIGHT, DOWN]:
+        if key in DIRECTIONS:
+            # Letter keys only move, arrow keys have no character.
             self._move(game, key)
+            return
 
-        if event.keysym in ['Down', 'Up', 'Left', 'Right']:
-            arrow = ARROWS_TO_DIRECTIONS[event.keysym]
-            # Logic to handle player shots zombies.
-            if inventory.has_active(CROSSBOW):
-                start = game.get_grid().find_player()
-                offset = game.direction_to_offset(arrow)
-                first = first_in_direction(game.get_grid(), start, offset)
-                if first is not None and first[1].display() in ZOMBIES:
-                    position, entity = first
-                    game.get_grid().remove_entity(position)
+        offset = _ARROW_OFFSETS.get(event.keysym)
+        if offset is None:
+            return
+
+        # Logic to handle player shots zombies, which needs a crossbow.
+        if not game.get_player().get_inventory().has_active(CROSSBOW):
+            return
+
+        grid = game.get_grid()
+        start = grid.find_player()
+        first = first_in_direction(grid, start, offset)
+        if first is not None and first[1].DISPLAY in ZOMBIES:
+            position, entity = first
+            grid.remove_entity(position)
 
     def _step(self, game):
         """
@@ -355,8 +471,23 @@ class BasicGraphicalInterface:
         self.draw(game)
         self._inventory.draw(game.get_player().get_inventory())
         # Trigger zombies to move per second.
-        self._after_identifier = self._master.after(1000,
-                                                    lambda: self._step(game))
+        self._schedule_step()
+
+    def _schedule_step(self):
+        """
+        Schedules the next step for one second after the previous step was
+        due, timed from the start of the game so that the time taken to
+        handle each step does not add up into drift.
+        """
+        self._steps_scheduled += 1
+        delay = self._started + self._steps_scheduled - time.monotonic()
+        if delay < 0:
+            # Running late, so take the next step now and time the rest from
+            # here rather than taking the missed steps in a burst.
+            self._started -= delay
+            delay = 0
+        self._after_identifier = self._master.after(round(delay * 1000),
+                                                    self._step_callback)
 
     def play(self, game):
         """
@@ -368,6 +499,13 @@ class BasicGraphicalInterface:
             game:The Game handles some of the logic for controlling the actions
                  of the player within the grid.
         """
+        # A new game starts from a blank map.
+        self._map.clear()
+        # The timer callback is made once per game rather than every second.
+        self._game = game
+        self._step_callback = lambda: self._step(self._game)
+        self._started = time.monotonic()
+        self._steps_scheduled = 0
         self._master.bind("<Key>",
                           lambda event: self._handle_keypress(event, game))
         inventory = game.get_player().get_inventory()
@@ -378,21 +516,18 @@ class BasicGraphicalInterface:
 
     def draw(self, game):
         """
-        Clears and redraws the view based on the current game state
+        Redraws the view based on the current game state, only touching
+        the map tiles that have changed since the last draw.
 
         Parameter:
             game:The Game handles some of the logic for controlling the actions
                  of the player within the grid.
         """
-        self._map.delete(tk.ALL)
-        self._inventory.delete(tk.ALL)
         # draw inventory
         inventory = game.get_player().get_inventory()
         self._inventory.draw(inventory)
         # draw map
-        game_serialize = game.get_grid().serialize()
-        for position in game_serialize:
-            self._map.draw_entity(position, game_serialize[position])
+        self._map.redraw(game.get_grid().serialize())
 
     def restart_game(self):
         """
@@ -400,6 +535,4 @@ class BasicGraphicalInterface:
         """
         self._master.after_cancel(self._after_identifier)
         game = advanced_game(MAP_FILE)
-        self._map.delete(tk.ALL)
-        self._inventory.delete(tk.ALL)
         self.play(game)
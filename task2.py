@@ -1,9 +1,80 @@
+import heapq
+import re
+import sys
 import tkinter as tk
 from tkinter import messagebox, simpledialog, filedialog
 from a2 import *
 from task1 import *
 from constants import *
-from PIL import Image, ImageTk
+
+
+# A line of a saved game: an entity as "(x, y):P", an inventory item as
+# "G=10" (a time machine has no lifetime) or a number such as the grid size.
+_SAVE_LINE = re.compile(
+    r"\((\d+),\s*(\d+)\)\s*:\s*(\S)|(\S)\s*=\s*(\d*)|(\d+)")
+
+# PhotoImages keyed by (path, size), so each image file is decoded and
+# scaled once per size for the whole program. Holding them here also stops
+# Tk discarding them while they are still shown.
+_IMAGE_CACHE = {}
+
+
+def _pil():
+    """
+    Return Pillow's Image and ImageTk modules, importing them the first time
+    an image is needed so that the text and basic graphical interfaces
+    start without loading Pillow at all.
+    """
+    from PIL import Image, ImageTk
+    return Image, ImageTk
+
+
+def _load(path, size=(CELL_SIZE, CELL_SIZE), smooth=False):
+    """
+    Return the image at the given path as a PhotoImage of the given
+    (width, height), loading it the first time it is requested.
+
+    Parameters:
+        path: Path of the image file.
+        size: (width, height) to scale the image to, in pixels.
+        smooth: Scale with a Lanczos filter, for large pictures such as the
+                banner, rather than the nearest neighbour scaling that
+                suits the small sprites most images are.
+    """
+    key = (path, size)
+    photo = _IMAGE_CACHE.get(key)
+    if photo is None:
+        Image, ImageTk = _pil()
+        resample = Image.LANCZOS if smooth else Image.NEAREST
+        with Image.open(path) as image:
+            photo = ImageTk.PhotoImage(image.resize(size, resample))
+        _IMAGE_CACHE[key] = photo
+    return photo
+
+
+# Tiled background images keyed by width, built once by the first ImageMap
+# of that width and kept so that Tk does not discard them between games.
+_BACKGROUND_CACHE = {}
+
+
+def _load_background(width):
+    """
+    Return a square PhotoImage of the given width, tiled with the background
+    image, building it the first time that width is requested.
+    """
+    if width not in _BACKGROUND_CACHE:
+        Image, ImageTk = _pil()
+        # The tile is a palette image, and a new image of that mode would
+        # have no palette, so tile in RGBA.
+        with Image.open(IMAGES[BACK_GROUND]) as source:
+            tile = source.convert('RGBA').resize((CELL_SIZE, CELL_SIZE),
+                                                 Image.NEAREST)
+        background = Image.new('RGBA', (width, width))
+        for x in range(0, width, CELL_SIZE):
+            for y in range(0, width, CELL_SIZE):
+                background.paste(tile, (x, y))
+        _BACKGROUND_CACHE[width] = ImageTk.PhotoImage(background)
+    return _BACKGROUND_CACHE[width]
 
 
 class StatusBar(tk.Frame):
@@ -32,10 +103,8 @@ class StatusBar(tk.Frame):
         super().__init__(master)
         self._master = master
         self._width = width
-        self._chasee = ImageTk.PhotoImage(Image.open("images/chasee.png").
-                                          resize((CELL_SIZE, CELL_SIZE)))
-        self._chaser = ImageTk.PhotoImage(Image.open("images/chaser.png").
-                                          resize((CELL_SIZE, CELL_SIZE)))
+        self._chasee = _load("images/chasee.png")
+        self._chaser = _load("images/chaser.png")
 
         # There are five frames in the bar, each frame occupies 1/5 bar width.
         FRAME_WIDTH = (INVENTORY_WIDTH + self._width) / 5
@@ -90,6 +159,33 @@ class StatusBar(tk.Frame):
         self._count = 0
         self._time = ""
         self._seconds = 0
+        # Text last shown on the move and timer labels, and whether a
+        # refresh of them is already waiting for the event loop to go idle.
+        self._shown_moves = "0 moves"
+        self._shown_time = "0 mins 0 seconds"
+        self._refresh_pending = False
+
+    def _schedule_refresh(self):
+        """
+        Refresh the labels once the event loop is idle, so that several
+        changes made in one burst of events only reconfigure them once.
+        """
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def _refresh(self):
+        """
+        Show the current move count and time on labels whose text changed.
+        """
+        self._refresh_pending = False
+        moves = f"{self._count} moves"
+        if moves != self._shown_moves:
+            self._move_text.config(text=moves)
+            self._shown_moves = moves
+        if self._time and self._time != self._shown_time:
+            self._timer_text.config(text=self._time)
+            self._shown_time = self._time
 
     def set_command(self, callback1, callback2):
         """
@@ -103,7 +199,7 @@ class StatusBar(tk.Frame):
         Count player's move steps.
         """
         self._count += 1
-        self._move_text.config(text=f"{self._count} moves")
+        self._schedule_refresh()
 
     def get_count(self):
         """
@@ -119,7 +215,7 @@ class StatusBar(tk.Frame):
              count: move steps which you want to set.
         """
         self._count = count
-        self._move_text.config(text=f"{self._count} moves")
+        self._schedule_refresh()
 
     def timer(self, step: int):
         """
@@ -133,8 +229,8 @@ class StatusBar(tk.Frame):
         self._seconds = step
         min = step // 60
         second = step % 60
-        self._timer_text.config(text=f"{min} mins {second} seconds")
         self._time = f"{min} mins {second} seconds"
+        self._schedule_refresh()
 
     def get_timer(self):
         """
@@ -153,7 +249,7 @@ class StatusBar(tk.Frame):
         Clear steps and time
         """
         self._count = 0
-        self._move_text.config(text="0 moves")
+        self._schedule_refresh()
 
 
 class ImageMap(BasicMap):
@@ -166,35 +262,37 @@ class ImageMap(BasicMap):
         super().__init__(master, size)
         self._size = size * CELL_SIZE
 
-        self._arrow = ImageTk.PhotoImage(Image.open(IMAGES[ARROW]).
-                                         resize((CELL_SIZE, CELL_SIZE)))
-        self._crossbow = ImageTk.PhotoImage(Image.open(IMAGES[CROSSBOW]).
-                                            resize((CELL_SIZE, CELL_SIZE)))
-        self._garlic = ImageTk.PhotoImage(Image.open(IMAGES[GARLIC]).
-                                          resize((CELL_SIZE, CELL_SIZE)))
-        self._hero = ImageTk.PhotoImage(Image.open(IMAGES[PLAYER]).
-                                        resize((CELL_SIZE, CELL_SIZE)))
-        self._hospital = ImageTk.PhotoImage(Image.open(IMAGES[HOSPITAL]).
-                                            resize((CELL_SIZE, CELL_SIZE)))
-        self._zombie = ImageTk.PhotoImage(Image.open(IMAGES[ZOMBIE]).
-                                          resize((CELL_SIZE, CELL_SIZE)))
-        self._background = ImageTk.PhotoImage(Image.open(IMAGES[BACK_GROUND]).
-                                          resize((CELL_SIZE, CELL_SIZE)))
-
-        self._image = {
-            PLAYER: self._hero,
-            HOSPITAL: self._hospital,
-            ZOMBIE: self._zombie,
-            GARLIC: self._garlic,
-            TRACKING_ZOMBIE: self._zombie,
-            CROSSBOW: self._crossbow,
-            ARROW: self._arrow,
-            BACK_GROUND: self._background
-        }
+        self._image = {tile_type: _load(path)
+                       for tile_type, path in IMAGES.items()}
+        self._background = _load_background(self._size)
 
     def draw_entity(self, position, tile_type):
-        center = self.get_position_center(position)
-        self.create_image(center[0], center[1], image=self._image[tile_type])
+        x, y = self.get_position_center(position)
+        return (self.create_image(x, y, image=self._image[tile_type]),)
+
+    def draw_background(self):
+        """
+        Draws the whole tiled background as a single canvas image.
+        """
+        self.create_image(0, 0, anchor=tk.NW, image=self._background)
+
+    def clear(self):
+        super().clear()
+        # One image item per cell that has shown an entity, kept for the
+        # rest of the game and hidden while its cell is empty.
+        self._cell_items = {}
+
+    def set_entity(self, position, tile_type):
+        item = self._cell_items.get(position)
+        if item is None:
+            (self._cell_items[position],) = self.draw_entity(position,
+                                                             tile_type)
+        else:
+            self.itemconfigure(item, image=self._image[tile_type],
+                               state=tk.NORMAL)
+
+    def erase_entity(self, position):
+        self.itemconfigure(self._cell_items[position], state=tk.HIDDEN)
 
 
 class FileMenu(tk.Menu):
@@ -204,7 +302,11 @@ class FileMenu(tk.Menu):
     def __init__(self, master, menus):
         """
         master: Main window of the drawing application.
-        menus: Details of all the menus for this window.
+        menus: Details of all the menus for this window, as (name, items)
+               pairs where items is a sequence of (label, command, sequence)
+               triples in the order they appear in the menu. sequence is
+               the Tk event sequence of the item's keyboard shortcut, such
+               as "<Control-s>", or None if it has none.
         """
         super().__init__(master)
         master.config(menu=self)
@@ -216,8 +318,20 @@ class FileMenu(tk.Menu):
             menu_to_add = tk.Menu(self)
             self.add_cascade(label=menu_details[MENU_NAME], menu=menu_to_add)
             # Extract all items for each menu and add them to the menu.
-            for menu_item, event_handler in menu_details[MENU_ITEMS].items():
-                menu_to_add.add_command(label=menu_item, command=event_handler)
+            for menu_item, event_handler, sequence in menu_details[MENU_ITEMS]:
+                if sequence is None:
+                    menu_to_add.add_command(label=menu_item,
+                                            command=event_handler)
+                    continue
+
+                # Show "<Control-s>" as "Ctrl+S" next to the item.
+                modifier, key = sequence.strip('<>').rsplit('-', 1)
+                accelerator = f"{modifier.replace('Control', 'Ctrl')}+" \
+                              f"{key.upper()}"
+                menu_to_add.add_command(label=menu_item, command=event_handler,
+                                        accelerator=accelerator)
+                master.bind(sequence,
+                            lambda event, handler=event_handler: handler())
 
 
 class ImageGraphicalInterface(BasicGraphicalInterface):
@@ -225,19 +339,20 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
     The BasicGraphicalInterface should manage the overall view
      (i.e. constructing the three "major widgets) and event handling."""
 
+    # Menus of the window as (name, items) pairs, where items are (label,
+    # method name, shortcut sequence) triples. Methods are looked up on the
+    # interface when the menu is created, so subclasses' overrides are used.
+    _MENUS = (("File", (("Restart game", "restart_game", "<Control-r>"),
+                        ("Save game", "save_game", "<Control-s>"),
+                        ("Load game", "load_game", "<Control-o>"),
+                        ("High score", "show_high_scores", None),
+                        ("Quit", "quit", "<Control-q>"))),)
+
     def __init__(self, root, size):
         self._master = root
         self._size = size
         self._width = self._height = CELL_SIZE * self._size
-        self._banner_frame = tk.Frame(self._master)
-        self._banner_frame.pack(side=tk.TOP)
-        self._banner_logo = self._banner = ImageTk.PhotoImage \
-            (Image.open("images/banner.png").resize
-             ((self._width + INVENTORY_WIDTH,
-               BANNER_HEIGHT)))
-
-        self._label = tk.Label(self._banner_frame, image=self._banner_logo)
-        self._label.pack()
+        self._create_banner()
 
         self._game_frame = tk.Frame(self._master)
         self._game_frame.pack()
@@ -256,13 +371,52 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         self._statusbar.pack()
         self._statusbar.set_command(self.restart_game, self.quit)
 
-        FileMenu(self._master, [("File", {"Restart game":
-                                              self.restart_game,
-                                          "Save game": self.save_game,
-                                          "Load game": self.load_game,
-                                          "High score": self.show_high_scores,
-                                          "Quit": self.quit})
-                                ])
+        self._create_menu()
+        self._init_saved_state()
+
+    def _create_banner(self):
+        """
+        Show the banner across the top of the window.
+        """
+        self._banner_frame = tk.Frame(self._master)
+        self._banner_frame.pack(side=tk.TOP)
+        width = self._width + INVENTORY_WIDTH
+        # The banner is scaled once per window width and then reused from
+        # the image cache, so the slower but sharper filter costs nothing
+        # after the first game.
+        self._banner_logo = self._banner = _load(
+            "images/banner.png", (width, BANNER_HEIGHT), smooth=True)
+
+        self._banner_canvas = tk.Canvas(self._banner_frame, width=width,
+                                        height=BANNER_HEIGHT,
+                                        highlightthickness=0)
+        self._banner_canvas.create_image(0, 0, anchor=tk.NW,
+                                         image=self._banner_logo)
+        self._banner_canvas.pack()
+
+    def _init_saved_state(self):
+        """
+        Set up the state the interface keeps from one game to the next.
+        """
+        # Serialized grid of MAP_FILE, kept after the first restart so that
+        # later restarts rebuild the game without reading the map file again.
+        self._initial_serial = None
+        # Top scores as returned by get_high_scores, read from
+        # HIGH_SCORES_FILE the first time they are needed and then kept up
+        # to date as new scores are written, so the file is only read once
+        # per run. _third_score is the time a win has to beat to get on the
+        # board, refreshed with them.
+        self._high_scores = None
+        self._third_score = float("inf")
+
+    def _create_menu(self):
+        """
+        Add the menus in _MENUS to the window and bind their shortcuts.
+        """
+        FileMenu(self._master,
+                 tuple((name, tuple((label, getattr(self, method), sequence)
+                                    for label, method, sequence in items))
+                       for name, items in self._MENUS))
 
     def _move(self, game, direction):
         """
@@ -283,12 +437,7 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         self.draw(game)
         if game.has_won():
             self._master.after_cancel(self._after_identifier)
-            try:
-                self._third_score = self.get_high_scores()[2][0]
-            except IndexError:
-                self._third_score = float("inf")
-
-            if self._statusbar.get_seconds() < self._third_score:
+            if self._statusbar.get_seconds() < self._score_to_beat():
                 self.prompt_name()
             else:
                 ask = messagebox.askyesno(title=WIN_MESSAGE, message='Play '
@@ -317,35 +466,17 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         """
         return self._game
 
-    def draw(self, game):
-        """
-        Clears and redraws the view based on the current game state
-
-        Parameter:
-            game:The Game handles some of the logic for controlling the actions
-                 of the player within the grid.
-        """
-        self._map.delete(tk.ALL)
-        self._inventory.delete(tk.ALL)
-        # draw inventory
-        inventory = game.get_player().get_inventory()
-        self._inventory.draw(inventory)
-        # draw map
-        for i in range(game.get_grid().get_size()):
-            for j in range(game.get_grid().get_size()):
-                self._map.draw_entity((i, j), BACK_GROUND)
-        game_serial = game.get_grid().serialize()
-        for position in game_serial:
-            self._map.draw_entity(position, game_serial[position])
-
     def restart_game(self):
         """
         This method will cause game and status bar to its original state.
         """
         self._master.after_cancel(self._after_identifier)
-        game = advanced_game(MAP_FILE)
-        self._map.delete(tk.ALL)
-        self._inventory.delete(tk.ALL)
+        if self._initial_serial is None:
+            game = advanced_game(MAP_FILE)
+            self._initial_serial = game.get_grid().serialize()
+        else:
+            game = load_new_game(AdvancedMapLoader().load_game(
+                Grid(self._size), self._initial_serial))
         self._statusbar.reset()
         self.play(game)
 
@@ -356,18 +487,21 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         self._master.after_cancel(self._after_identifier)
         file_name = filedialog.asksaveasfilename()
         if file_name:
-            with open(file_name, 'w') as file:
-                serial = self.get_game().get_grid().serialize()
-                for key in serial:
-                    file.write(f"{key}:{serial[key]}\n")
+            game = self.get_game()
+            grid = game.get_grid()
+            lines = [f"{position}:{tile_type}\n"
+                     for position, tile_type in grid.serialize().items()]
 
-                inventory = self.get_game().get_player().get_inventory().get_items()
-                for item in inventory:
-                    file.write(f"{item.display()}={item.get_lifetime()}\n")
+            inventory = game.get_player().get_inventory().get_items()
+            lines += [f"{item.DISPLAY}={item.get_lifetime()}\n"
+                      for item in inventory]
 
-                file.write(f"{self.get_game().get_grid().get_size()}\n")
-                file.write(f"{self.get_game().get_steps()}\n")
-                file.write(f"{self._statusbar.get_count()}\n")
+            lines.append(f"{grid.get_size()}\n{game.get_steps()}\n"
+                         f"{self._statusbar.get_count()}\n")
+
+            # The whole save is formatted first and written in one call.
+            with open(file_name, 'w') as file:
+                file.write("".join(lines))
 
     def load_game(self):
         """
@@ -375,51 +509,50 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         """
         self._master.after_cancel(self._after_identifier)
         file_name = filedialog.askopenfilename()
+        if not file_name:
+            return
+
         try:
-            if file_name:
-                with open(file_name, 'r') as file:
-                    mapping = {}
-                    inventory = {}
-                    other_info = []
+            with open(file_name, 'r') as file:
+                mapping = {}
+                inventory = {}
+                other_info = []
+                for line in file.read().splitlines():
+                    match = _SAVE_LINE.fullmatch(line.strip())
+                    if match is None:
+                        raise ValueError(f"Invalid save line: {line!r}")
+
+                    x, y, entity, item, lifetime, number = match.groups()
                     # Get mapping data.
-                    for line in file:
-                        line = line.strip()
-                        if line.count(':') == 1:
-                            name, value = line.split(':')
-                            mapping[str_tuple(name.strip())] = value.strip()
-                        # Get inventory data.
-                        elif line.count('=') == 1:
-                            item, lifetime = line.split('=')
-                            inventory[item.strip()] = int(lifetime.strip())
-                        # Get moves and steps data.
-                        else:
-                            other_info.append(int(line))
-
-                grid_size = other_info[0]
-                game_steps = other_info[1]
-                moves = other_info[2]
-
-                # Initialise new game using data got above.
-                new_grid = AdvancedMapLoader().load_game(Grid(grid_size),
-                                                         mapping)
-                new_game = load_new_game(new_grid)
-                for item in inventory:
-                    pickup = str_to_item(item)
-                    new_game.get_player().get_inventory().add_item(pickup)
-                    pickup.set_lifetime(inventory[item])
-
-                new_game.change_steps(game_steps - 1)
-                self._statusbar.change_count(moves)
-                self._map.delete(tk.ALL)
-                self._inventory.delete(tk.ALL)
-                self.play(new_game)
-
-        except ValueError:
-            toplevel = tk.Toplevel(self._master)
-            toplevel.title('Error')
-            toplevel.geometry("300x100")
-            tk.Label(toplevel, text="Please choose a correct \nfile to be "
-                                    "loaded!", font=20).pack()
+                    if entity is not None:
+                        mapping[(int(x), int(y))] = entity
+                    # Get inventory data.
+                    elif item is not None:
+                        inventory[item] = int(lifetime) if lifetime else ''
+                    # Get moves and steps data.
+                    else:
+                        other_info.append(int(number))
+
+            grid_size, game_steps, moves = other_info
+
+            # Initialise new game using data got above.
+            new_grid = AdvancedMapLoader().load_game(Grid(grid_size), mapping)
+            new_game = load_new_game(new_grid)
+            for item in inventory:
+                pickup = str_to_item(item)
+                if pickup is None:
+                    raise ValueError(f"Unknown item: {item!r}")
+                new_game.get_player().get_inventory().add_item(pickup)
+                pickup.set_lifetime(inventory[item])
+
+        except (ValueError, KeyError, OSError):
+            messagebox.showerror('Error',
+                                 'Please choose a correct file to be loaded!')
+            return
+
+        new_game.change_steps(game_steps - 1)
+        self._statusbar.change_count(moves)
+        self.play(new_game)
 
     def prompt_name(self):
         """
@@ -445,6 +578,27 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
                                      self.restart_game()])
         button_again.pack(side=tk.RIGHT, padx=20, pady=10)
 
+    def _set_high_scores(self, scores):
+        """
+        Keep the given top scores and the time needed to get among them.
+
+        Parameters:
+            scores: (time, name) pairs from the fastest time.
+        """
+        self._high_scores = scores
+        if len(scores) < MAX_ALLOWED_HIGH_SCORES:
+            self._third_score = float("inf")
+        else:
+            self._third_score = scores[-1][0]
+
+    def _score_to_beat(self):
+        """
+        Get the time a win has to beat to be put on the high scores board.
+        """
+        if self._high_scores is None:
+            self._set_high_scores(self._read_high_scores())
+        return self._third_score
+
     def write_name_to_file(self, name):
         """
         Put name entered by user in high_scores file.
@@ -452,31 +606,52 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         Parameters:
             name: Name that user enters.
         """
-        file = open(HIGH_SCORES_FILE, 'a')
-        file.write(f"{self._statusbar.get_seconds()}:{name}\n")
-        file.close()
+        seconds = self._statusbar.get_seconds()
+        # Taken before the new line is written, so that reading the file
+        # here for the first time does not count the new score twice.
+        high_scores = self.get_high_scores()
+        with open(HIGH_SCORES_FILE, 'a') as file:
+            file.write(f"{seconds}:{name}\n")
+
+        # Names with a colon are skipped when the file is read back, so they
+        # are left off the board here too. A new score ranks after equal
+        # times already on the board, so it goes last before the fastest
+        # ones are picked again.
+        if ':' not in name:
+            high_scores.append((seconds, name.strip()))
+            self._set_high_scores(heapq.nsmallest(
+                MAX_ALLOWED_HIGH_SCORES, high_scores,
+                key=lambda score: score[0]))
 
     def get_high_scores(self):
         """
-        SGet top 3 scores in the high_scores file.
+        Get top 3 scores in the high_scores file, as (time, name) pairs from
+        the fastest time. Players with equal times are all kept, the one
+        who got the time first is ranked higher.
+        """
+        if self._high_scores is None:
+            self._set_high_scores(self._read_high_scores())
+        return list(self._high_scores)
+
+    @staticmethod
+    def _read_high_scores():
+        """
+        Read the top 3 scores from the high_scores file, creating the file
+        if it does not exist yet.
         """
         try:
-            open(HIGH_SCORES_FILE, 'r')
-        except IOError:
-            open(HIGH_SCORES_FILE, 'w')
-
-        with open(HIGH_SCORES_FILE, 'r') as file:
-            rank = {}
-            count = 0
-            for line in file:
-                line = line.strip()
-                count += 1
-                if line.count(':') == 1:
-                    name, value = line.split(':')
-                    rank[int(name.strip())] = value.strip()
-            top_3 = sorted(rank.items(), key=lambda x: x[0])[
-                    :MAX_ALLOWED_HIGH_SCORES]
-            return top_3
+            with open(HIGH_SCORES_FILE, 'r') as file:
+                lines = (line.strip() for line in file)
+                entries = (line.split(':') for line in lines
+                           if line.count(':') == 1)
+                scores = ((int(time.strip()), name.strip())
+                          for time, name in entries)
+                return heapq.nsmallest(MAX_ALLOWED_HIGH_SCORES, scores,
+                                       key=lambda score: score[0])
+        except FileNotFoundError:
+            # Create the file so that scores can be appended to it later.
+            open(HIGH_SCORES_FILE, 'w').close()
+            return []
 
     def show_high_scores(self):
         """
@@ -487,14 +662,15 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         tk.Label(toplevel, text="High scores", fg="white",
                  bg=DARKEST_PURPLE, font=('Calibri', 40)).pack(fill=tk.X)
 
-        top_3 = self.get_high_scores()
-        for score in top_3:
-            time, player = score
+        # All the scores go in one widget, one per line.
+        lines = []
+        for time, player in self.get_high_scores():
             if time >= 60:
-                text = f"{player}: {time // 60}m {time % 60}s"
+                lines.append(f"{player}: {time // 60}m {time % 60}s")
             else:
-                text = f"{player}: {time}s"
-            tk.Label(toplevel, text=text).pack()
+                lines.append(f"{player}: {time}s")
+        tk.Message(toplevel, text="\n".join(lines), width=300,
+                   justify=tk.CENTER).pack()
         tk.Button(toplevel, text="Done", command=toplevel.destroy).pack()
 
     def quit(self):
@@ -503,13 +679,9 @@ class ImageGraphicalInterface(BasicGraphicalInterface):
         """
         if messagebox.askyesno(title='Quit', message="Are you sure to quit "
                                                      "the game?"):
-            exit()
-
-
-def str_tuple(x: str):
-    """
-    Convert a tuple of string format to a real tuple.
-    Example: "(1, 2)" -> (1, 2)
-    """
-    temp = x.replace('(', '').replace(')', '')
-    return tuple([int(i) for i in temp.split(',')])
+            # Let go of the images while Tk is still up to free them, then
+            # close the window before leaving.
+            _IMAGE_CACHE.clear()
+            _BACKGROUND_CACHE.clear()
+            self._master.destroy()
+            sys.exit(0)